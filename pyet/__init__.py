@@ -47,5 +47,6 @@ from .rad_utils import (
     calc_rad_sol_in,
     calc_rso,
 )
+from .batch import calculate_batch
 from .version import __version__
 from .utils import show_versions
@@ -0,0 +1,64 @@
+"""The batch module contains functions to estimate PET for many sites at once.
+
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas
+
+
+def calculate_batch(method, sites, max_workers=1, **kwargs):
+    """Potential evapotranspiration for many sites, computed in parallel.
+
+    Parameters
+    ----------
+    method: function
+        pyet method used to estimate the potential evapotranspiration,
+        e.g. pyet.pm_fao56.
+    sites: dict
+        dictionary with the site names as keys and, as values, a pandas.DataFrame
+        or dict with the arguments of the method for that site, e.g. a
+        pandas.DataFrame with the columns "tmean", "wind", "rs" and "rh".
+    max_workers: int, optional
+        maximum number of processes used. By default (1), the sites are computed
+        one after the other in the current process. If None, the number of
+        processors on the machine is used.
+    kwargs: dict, optional
+        arguments passed to the method for all sites, e.g. elevation or lat.
+        Arguments provided per site take precedence.
+
+    Returns
+    -------
+    pandas.DataFrame containing the calculated potential evapotranspiration [mm d-1]
+    with a column for each site.
+
+    Examples
+    --------
+    >>> pe_sites = calculate_batch(pm_fao56, {"site1": df1, "site2": df2}, lat=0.9)
+
+    Notes
+    -----
+    With max_workers other than 1, each site is computed in a separate process,
+    which only pays off if computing a site takes longer than starting a process
+    and sending the data to it, i.e., for many sites or long time series (roughly
+    more than a thousand time steps).
+
+    Where new processes are started by importing the calling script (the "spawn"
+    and "forkserver" start methods, the default on Windows and macOS and, from
+    Python 3.14, on Linux), the script must call calculate_batch under an
+    ``if __name__ == "__main__":`` guard. Otherwise, each process runs the script
+    again and the computation fails:
+
+    >>> if __name__ == "__main__":
+    ...     pe_sites = calculate_batch(pm_fao56, sites, max_workers=None, lat=0.9)
+
+    """
+    names = list(sites)
+    site_kwargs = [{**kwargs, **dict(sites[name])} for name in names]
+    if max_workers == 1:
+        pets = [method(**site_kw) for site_kw in site_kwargs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(method, **site_kw) for site_kw in site_kwargs]
+            pets = [future.result() for future in futures]
+    return pandas.concat(pets, axis=1, keys=names)
@@ -11,12 +11,15 @@ from .meteo_utils import (
     calc_press,
     calc_psy,
     calc_vpc,
-    calc_ea,
-    calc_es,
+    calc_e0,
     calc_rho,
     calc_res_surf,
     calc_res_aero,
     day_of_year,
+    extraterrestrial_r,
+    _vpc_from_e0,
+    _es_from_e0,
+    _ea_from_e0,
 )
 from .radiation import (
     jensen_haise,
@@ -29,8 +32,16 @@ from .radiation import (
     oudin,
 )
 from .temperature import blaney_criddle, romanenko, linacre, haude, hamon
-from .rad_utils import calc_rad_net
-from .utils import clip_zeros, get_index, check_rh, pet_out
+from .rad_utils import calc_rad_net, calc_rso
+from .utils import (
+    clip_zeros,
+    get_index,
+    check_rh,
+    pet_out,
+    match_dtype,
+    unwrap_aligned,
+    wrap_aligned,
+)
 
 # Specific heat of air [MJ kg-1 °C-1]
 CP = 1.013 * 10**-3
@@ -172,9 +183,9 @@ def penman(
     fu = aw + bw * wind
 
     den = dlt + gamma
-    num1 = dlt * (rn - g) / den / lambd
-    num2 = gamma * (es - ea) * fu / den
-    pet = num1 + num2
+    num1 = dlt * (rn - g) / lambd
+    num2 = gamma * (es - ea) * fu
+    pet = (num1 + num2) / den
     pet = clip_zeros(pet, clip_zero)
     return pet_out(tmean, pet, "Penman")
 
@@ -318,9 +329,9 @@ def pm_asce(
         cd = 0.38
 
     den = dlt + gamma * (1 + cd * wind)
-    num1 = (0.408 * dlt * (rn - g)) / den
-    num2 = gamma * cn / (tmean + 273) * wind * (es - ea) / den
-    pet = num1 + num2
+    num1 = 0.408 * dlt * (rn - g)
+    num2 = gamma * cn / (tmean + 273) * wind * (es - ea)
+    pet = (num1 + num2) / den
     pet = clip_zeros(pet, clip_zero)
     return pet_out(tmean, pet, "PM_ASCE")
 
@@ -513,9 +524,9 @@ def pm(
     rho_a = calc_rho(pressure, tmean, ea)
 
     den = lambd * (dlt + gamma1)
-    num1 = dlt * (rn - g) / den
-    num2 = rho_a * CP * kmin * (es - ea) * a_sh / res_a / den
-    pet = num1 + num2
+    num1 = dlt * (rn - g)
+    num2 = CP * kmin * a_sh * rho_a * (es - ea) / res_a
+    pet = (num1 + num2) / den
     pet = clip_zeros(pet, clip_zero)
     return pet_out(tmean, pet, "Penman_Monteith")
 
@@ -545,6 +556,7 @@ def pm_fao56(
     as1=0.25,
     bs1=0.5,
     clip_zero=True,
+    doy=None,
 ):
     """Potential evapotranspiration calculated according to
     :cite:t:`allen_crop_1998`.
@@ -600,16 +612,25 @@ def pm_fao56(
         empirical coefficient for extraterrestrial radiation [-].
     clip_zero: bool, optional
         if True, replace all negative values with 0.
+    doy: float or array_like, optional
+        day of the year [-], used with rs and a float lat instead of the dates of
+        the inputs, e.g. for float inputs.
 
     Returns
     -------
-    pandas.Series or xarray.DataArray containing the calculated potential
+    float or pandas.Series or xarray.DataArray containing the calculated potential
     evapotranspiration [mm d-1].
 
     Examples
     --------
     >>> et_fao56 = pm_fao56(tmean, wind, rn=rn, rh=rh)
 
+    With float inputs, e.g. for each cell with xarray.apply_ufunc(...,
+    vectorize=True), the day of the year replaces the dates:
+
+    >>> et_fao56 = pm_fao56(16.9, 2.078, rs=22.07, tmax=21.5, tmin=12.3, rh=73.5,
+    ...                     elevation=100, lat=0.87, doy=187)
+
     Notes
     -----
     .. math:: PET = \\frac{0.408 \\Delta (R_{n}-G)+\\gamma \\frac{900}{T+273}
@@ -644,12 +665,13 @@ def pm_fao56(
         as1,
         bs1,
         kab,
+        doy=doy,
     )
 
     den = dlt + gamma1
-    num1 = (0.408 * dlt * (rn - g)) / den
-    num2 = (gamma * (es - ea) * 900 * wind / (tmean + 273)) / den
-    pet = num1 + num2
+    num1 = 0.408 * dlt * (rn - g)
+    num2 = gamma * (es - ea) * 900 * wind / (tmean + 273)
+    pet = (num1 + num2) / den
     pet = clip_zeros(pet, clip_zero)
     return pet  # pet_out(tmean, pet, "PM_FAO_56")
 
@@ -903,9 +925,9 @@ def kimberly_penman(
     )
 
     tindex = get_index(tmean)
-    j = day_of_year(tindex)
+    j = match_dtype(day_of_year(tindex), tmean)
     if len(wind.shape) == 3:
-        j = j[:, newaxis, newaxis]
+        j = j.values[:, newaxis, newaxis]
     w = wind * (
         0.4
         + 0.14 * exp(-(((j - 173) / 58) ** 2))
@@ -913,9 +935,9 @@ def kimberly_penman(
     )
 
     den = lambd * (dlt + gamma)
-    num1 = dlt * (rn - g) / den
-    num2 = gamma * (es - ea) * w / den
-    pet = num1 + num2
+    num1 = dlt * (rn - g)
+    num2 = gamma * (es - ea) * w
+    pet = (num1 + num2) / den
     pet = clip_zeros(pet, clip_zero)
     return pet_out(tmean, pet, "Kimberly_Penman")
 
@@ -1009,8 +1031,8 @@ def thom_oliver(
     r_s: pandas.Series or float, optional
         bulk surface resistance [s m-1].
     ra_method: float, optional
-        1 => ra = 208/wind
-        2 => ra is calculated based on equation 36 in FAO (1990), ANNEX V.
+        0 => ra = 208/wind
+        1 => ra is calculated based on equation 36 in FAO (1990), ANNEX V.
     lai_eff: float, optional
         0 => LAI_eff = 0.5 * LAI
         1 => LAI_eff = lai / (0.3 * lai + 1.2)
@@ -1084,9 +1106,9 @@ def thom_oliver(
     w = aw * (1 + bw * wind)
 
     den = lambd * (dlt + gamma1)
-    num1 = dlt * (rn - g) / den
-    num2 = 2.5 * gamma * (es - ea) * w / den
-    pet = num1 + num2
+    num1 = dlt * (rn - g)
+    num2 = 2.5 * gamma * (es - ea) * w
+    pet = (num1 + num2) / den
     pet = clip_zeros(pet, clip_zero)
     return pet_out(tmean, pet, "Thom_Oliver")
 
@@ -1128,12 +1150,19 @@ def calculate_all(
     >>> pe_all = calculate_all(tmean, wind, rs, elevation, lat, tmax=tmax,
                                tmin=tmin, rh=rh)
     """
+    # Compute the inputs that only depend on the site once for all methods
+    pressure = calc_press(elevation)
+    ra = extraterrestrial_r(get_index(tmean), lat)
+    rso = calc_rso(ra=ra, elevation=elevation)
+
     pe_df = pandas.DataFrame()
     pe_df["Penman"] = penman(
         tmean,
         wind,
         rs=rs,
+        pressure=pressure,
         elevation=elevation,
+        rso=rso,
         lat=lat,
         tmax=tmax,
         tmin=tmin,
@@ -1145,7 +1174,9 @@ def calculate_all(
         tmean,
         wind,
         rs=rs,
+        pressure=pressure,
         elevation=elevation,
+        rso=rso,
         lat=lat,
         tmax=tmax,
         tmin=tmin,
@@ -1156,7 +1187,9 @@ def calculate_all(
     pe_df["Priestley-Taylor"] = priestley_taylor(
         tmean,
         rs=rs,
+        pressure=pressure,
         elevation=elevation,
+        rso=rso,
         lat=lat,
         tmax=tmax,
         tmin=tmin,
@@ -1168,7 +1201,9 @@ def calculate_all(
         tmean,
         wind,
         rs=rs,
+        pressure=pressure,
         elevation=elevation,
+        rso=rso,
         lat=lat,
         tmax=tmax,
         tmin=tmin,
@@ -1180,7 +1215,9 @@ def calculate_all(
         tmean,
         wind,
         rs=rs,
+        pressure=pressure,
         elevation=elevation,
+        rso=rso,
         lat=lat,
         tmax=tmax,
         tmin=tmin,
@@ -1201,9 +1238,9 @@ def calculate_all(
     pe_df["Jensen-Haise"] = jensen_haise(tmean, rs=rs)
     pe_df["Mcguinness-Bordne"] = mcguinness_bordne(tmean, lat=lat)
     pe_df["Hargreaves"] = hargreaves(tmean, tmax, tmin, lat)
-    pe_df["FAO-24"] = fao_24(tmean, wind, rs=rs, rh=rh, elevation=elevation)
+    pe_df["FAO-24"] = fao_24(tmean, wind, rs=rs, rh=rh, pressure=pressure)
     pe_df["Abtew"] = abtew(tmean, rs)
-    pe_df["Makkink"] = makkink(tmean, rs, elevation=elevation)
+    pe_df["Makkink"] = makkink(tmean, rs, pressure=pressure)
     pe_df["Oudin"] = oudin(tmean, lat=lat)
     return pe_df
 
@@ -1212,19 +1249,48 @@ def _lambda_gamma_dlt_ea_es(
     velevation, vpressure, vtmean, vtmax, vtmin, vrhmax, vrhmin, vrh, vea
 ):
     """Just ot avoid duplicated rows."""
+    index, name, (
+        velevation,
+        vpressure,
+        vtmean,
+        vtmax,
+        vtmin,
+        vrhmax,
+        vrhmin,
+        vrh,
+        vea,
+    ) = unwrap_aligned(
+        velevation, vpressure, vtmean, vtmax, vtmin, vrhmax, vrhmin, vrh, vea
+    )
+
     vpressure = calc_press(velevation, vpressure)
     gamma = calc_psy(vpressure)
-    dlt = calc_vpc(vtmean)
     lambd = calc_lambda(vtmean)
 
-    ea = calc_ea(
-        tmean=vtmean,
-        tmax=vtmax,
-        tmin=vtmin,
-        rhmax=check_rh(vrhmax),
-        rhmin=check_rh(vrhmin),
-        rh=check_rh(vrh),
-        ea=vea,
+    # Compute each saturation vapour pressure only once and reuse it below
+    e0mean = calc_e0(vtmean)
+    dlt = _vpc_from_e0(e0mean, vtmean)
+    if vtmax is not None:
+        e0max = calc_e0(vtmax)
+        e0min = calc_e0(vtmin)
+        es = _es_from_e0(e0max, e0min)
+    else:
+        e0max = e0min = None
+        es = e0mean
+
+    if vea is None:
+        ea = _ea_from_e0(
+            es,
+            e0max,
+            e0min,
+            rhmax=check_rh(vrhmax),
+            rhmin=check_rh(vrhmin),
+            rh=check_rh(vrh),
+        )
+    else:
+        ea = vea
+
+    vpressure, gamma, dlt, lambd, ea, es = (
+        wrap_aligned(x, index, name) for x in (vpressure, gamma, dlt, lambd, ea, es)
     )
-    es = calc_es(tmean=vtmean, tmax=vtmax, tmin=vtmin)
     return vpressure, gamma, dlt, lambd, ea, es
@@ -2,10 +2,14 @@
 
 """
 
-from numpy import cos, exp, isnan, log, pi, sin, tan
-from pandas import Series, to_numeric
+from functools import lru_cache
+
+from numpy import cos, exp, frombuffer, isnan, log, log1p, pi, sin, tan
+from pandas import Series
 from xarray import DataArray
-from numpy import arccos, clip, nanmax, where
+from numpy import arccos, clip, generic, nanmax, ndim, where
+
+from .utils import unwrap_aligned, wrap_aligned
 
 # Specific heat of air [MJ kg-1 °C-1]
 CP = 1.013 * 10**-3
@@ -67,8 +71,9 @@ def calc_vpc(tmean):
     Based on equation 13. in :cite:t:`allen_crop_1998`.
 
     """
-    es = calc_e0(tmean)
-    return 4098 * es / (tmean + 237.3) ** 2
+    index, name, (tmean,) = unwrap_aligned(tmean)
+    vpc = _vpc_from_e0(calc_e0(tmean), tmean)
+    return wrap_aligned(vpc, index, name)
 
 
 def calc_lambda(tmean):
@@ -116,13 +121,18 @@ def calc_press(elevation, pressure=None):
 
     Notes
     -----
-    Based on equation 7 in :cite:t:`allen_crop_1998`.
+    Based on equation 7 in :cite:t:`allen_crop_1998`. The pressure only depends on
+    the elevation, so for gridded elevation data it can be computed once and passed
+    to the evapotranspiration methods with the pressure argument.
 
     """
     if pressure is None and elevation is None:
-        raise Exception("Please provide either pressure or the elevation!")
+        raise ValueError("Please provide either pressure or the elevation!")
     if pressure is None:
-        return 101.3 * ((293 - 0.0065 * elevation) / 293) ** 5.26
+        # Equal to 101.3 * ((293 - 0.0065 * elevation) / 293) ** 5.26
+        pressure = 101.3 * exp(5.26 * log1p(-0.0065 / 293 * elevation))
+        # A numpy.float64 would upcast float32 xarray inputs, a Python float does not
+        return float(pressure) if isinstance(pressure, generic) else pressure
     else:
         return pressure
 
@@ -156,7 +166,7 @@ def calc_rho(pressure, tmean, ea):
 
     """
     # Virtual temperature [tkv]
-    tkv = (273.16 + tmean) * (1 - 0.378 * ea / pressure) ** -1
+    tkv = (273.16 + tmean) / (1 - 0.378 * ea / pressure)
     return 3.486 * pressure / tkv
 
 
@@ -211,12 +221,12 @@ def calc_es(tmean=None, tmax=None, tmin=None):
     Based on equation 11, 12 in :cite:t:`allen_crop_1998`.
 
     """
+    index, name, (tmean, tmax, tmin) = unwrap_aligned(tmean, tmax, tmin)
     if tmax is not None:
-        eamax = calc_e0(tmax)
-        eamin = calc_e0(tmin)
-        return (eamax + eamin) / 2
+        es = _es_from_e0(calc_e0(tmax), calc_e0(tmin))
     else:
-        return calc_e0(tmean)
+        es = calc_e0(tmean)
+    return wrap_aligned(es, index, name)
 
 
 def calc_ea(tmean=None, tmax=None, tmin=None, rhmax=None, rhmin=None, rh=None, ea=None):
@@ -250,21 +260,26 @@ def calc_ea(tmean=None, tmax=None, tmin=None, rhmax=None, rhmin=None, rh=None, e
 
     Notes
     -----
-    Based on equation 17, 19 in :cite:t:`allen_crop_1998`.
+    Based on equation 17, 18, 19 in :cite:t:`allen_crop_1998`. Equation 17 is
+    used if rhmax and rhmin are provided, equation 18 if only rhmax is provided
+    and equation 19 if rh is provided. If more than one of these is provided,
+    missing values of the preferred estimate are filled with the next one.
 
     """
     if ea is not None:
         return ea
-    if rhmax is not None:  # eq. 11
-        esmax = calc_e0(tmax)
-        esmin = calc_e0(tmin)
-        return (esmin * rhmax / 200) + (esmax * rhmin / 200)
-    else:  # eq. 14
-        if tmax is not None:
-            es = calc_es(tmax=tmax, tmin=tmin)
-        else:
-            es = calc_e0(tmean)
-        return rh / 100 * es
+    index, name, (tmean, tmax, tmin, rhmax, rhmin, rh) = unwrap_aligned(
+        tmean, tmax, tmin, rhmax, rhmin, rh
+    )
+    if tmax is not None:
+        e0max = calc_e0(tmax)
+        e0min = calc_e0(tmin)
+        es = _es_from_e0(e0max, e0min)
+    else:
+        e0max = e0min = None
+        es = calc_e0(tmean)
+    ea = _ea_from_e0(es, e0max, e0min, rhmax=rhmax, rhmin=rhmin, rh=rh)
+    return wrap_aligned(ea, index, name)
 
 
 def day_of_year(tindex):
@@ -279,7 +294,7 @@ def day_of_year(tindex):
     array_like with ints specifying day of year.
 
     """
-    return Series(to_numeric(tindex.strftime("%j")), tindex, dtype=int)
+    return Series(tindex.dayofyear, tindex, dtype=int)
 
 
 def solar_declination(j):
@@ -394,23 +409,44 @@ def extraterrestrial_r(tindex, lat):
 
     Notes
     -----
-    Based on equation 21 in :cite:t:`allen_crop_1998`.
+    Based on equation 21 in :cite:t:`allen_crop_1998`. For a float latitude, the
+    results are cached per latitude and sequence of days of the year, so repeated
+    calls for the same site and period are not recomputed.
 
     """
     j = day_of_year(tindex)
+    if isinstance(lat, (float, int)):
+        ra = _extraterrestrial_r_cached(j.values.astype(int).tobytes(), float(lat))
+        return Series(ra, tindex, copy=True)
+
+    if not isinstance(lat, DataArray):
+        return _extraterrestrial_r(j, lat)
+
     dr = relative_distance(j)
     sol_dec = solar_declination(j)
+    omega = sunset_angle(sol_dec, lat)
+    lat = lat.expand_dims(dim={"time": sol_dec.index}, axis=0)
+    xx = sin(sol_dec.values) * sin(lat.T)
+    yy = cos(sol_dec.values) * cos(lat.T)
+    return (118.08 / 3.141592654 * dr.values * (omega.T * xx + yy * sin(omega.T))).T
 
+
+def _extraterrestrial_r(j, lat):
+    """Extraterrestrial daily radiation for a latitude that is not a DataArray."""
+    dr = relative_distance(j)
+    sol_dec = solar_declination(j)
     omega = sunset_angle(sol_dec, lat)
-    if isinstance(lat, DataArray):
-        lat = lat.expand_dims(dim={"time": sol_dec.index}, axis=0)
-        xx = sin(sol_dec.values) * sin(lat.T)
-        yy = cos(sol_dec.values) * cos(lat.T)
-        return (118.08 / 3.141592654 * dr.values * (omega.T * xx + yy * sin(omega.T))).T
-    else:
-        xx = sin(sol_dec) * sin(lat)
-        yy = cos(sol_dec) * cos(lat)
-        return 118.08 / 3.141592654 * dr * (omega * xx + yy * sin(omega))
+    xx = sin(sol_dec) * sin(lat)
+    yy = cos(sol_dec) * cos(lat)
+    return 118.08 / 3.141592654 * dr * (omega * xx + yy * sin(omega))
+
+
+@lru_cache(maxsize=32)
+def _extraterrestrial_r_cached(j_bytes, lat):
+    """Extraterrestrial daily radiation for a float latitude, cached by day of year."""
+    ra = _extraterrestrial_r(frombuffer(j_bytes, dtype=int), lat)
+    ra.setflags(write=False)
+    return ra
 
 
 def calc_res_surf(
@@ -443,7 +479,7 @@ def calc_res_surf(
     resistance [s / m]
 
     """
-    if r_s:
+    if r_s is not None:
         return r_s
     else:
         fco2 = 1 + srs * (co2 - 300)
@@ -484,6 +520,7 @@ def calc_laieff(lai=None, lai_eff=0):
         laie = lai.copy()
         laie[lai > 4] = 4
         return laie * 0.5
+    raise ValueError("lai_eff can be either 0, 1, 2 or 3.")
 
 
 def calc_res_aero(wind, croph=0.12, zw=2, zh=2, ra_method=0):
@@ -509,10 +546,50 @@ def calc_res_aero(wind, croph=0.12, zw=2, zh=2, ra_method=0):
 
     """
     if ra_method == 0:
-        wind = wind.where(wind != 0, 0.0001)
+        if isinstance(wind, (Series, DataArray)):
+            wind = wind.where(wind != 0, 0.0001)
+        else:
+            wind = where(wind != 0, wind, 0.0001)
         return 208 / wind
-    else:
+    elif ra_method == 1:
         d = 0.667 * croph
         zom = 0.123 * croph
         zoh = 0.0123 * croph
         return (log((zw - d) / zom)) * (log((zh - d) / zoh) / (0.41**2) / wind)
+    else:
+        raise ValueError("ra_method can be either 0 or 1.")
+
+
+def _vpc_from_e0(e0, tmean):
+    """Slope of saturation vapour pressure curve from an already computed e0."""
+    return 4098 * e0 / (tmean + 237.3) ** 2
+
+
+def _es_from_e0(e0max, e0min):
+    """Saturation vapor pressure from already computed e0(tmax) and e0(tmin)."""
+    return (e0max + e0min) / 2
+
+
+def _ea_from_e0(es, e0max=None, e0min=None, rhmax=None, rhmin=None, rh=None):
+    """Actual vapor pressure from already computed saturation vapor pressures."""
+    if rhmax is not None and e0min is None:
+        raise ValueError("Please provide tmax and tmin when using rhmax and rhmin!")
+    eas = []
+    if rhmax is not None and rhmin is not None:  # eq. 17
+        eas.append((e0min * rhmax / 200) + (e0max * rhmin / 200))
+    if rhmax is not None:  # eq. 18
+        eas.append(e0min * rhmax / 100)
+    if rh is not None:  # eq. 19
+        eas.append(rh / 100 * es)
+    if not eas:
+        raise ValueError("Please provide either rhmax and rhmin, rhmax or rh!")
+
+    ea = eas[0]
+    for ea_fill in eas[1:]:
+        if isinstance(ea, (Series, DataArray)):
+            ea = ea.where(ea.notnull(), ea_fill)
+        elif ndim(ea) == 0 and ndim(ea_fill) == 0:
+            ea = ea_fill if isnan(ea) else ea
+        else:
+            ea = where(isnan(ea), ea_fill, ea)
+    return ea
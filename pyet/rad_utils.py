@@ -2,15 +2,20 @@
 
 """
 
-from numpy import sqrt, clip, newaxis
+from numpy import maximum, minimum, ndim, newaxis, sqrt
 
 from pandas import Series
 
 from xarray import DataArray
 
-from .meteo_utils import calc_ea, extraterrestrial_r, daylight_hours
+from .meteo_utils import (
+    calc_ea,
+    daylight_hours,
+    extraterrestrial_r,
+    _extraterrestrial_r,
+)
 
-from .utils import get_index, check_rad, vectorize
+from .utils import get_index, check_rad, match_dtype, unwrap_aligned, wrap_aligned
 
 # Stefan Boltzmann constant - hourly [MJm-2K-4h-1]
 STEFAN_BOLTZMANN_HOUR = 2.042 * 10**-10
@@ -39,6 +44,7 @@ def calc_rad_net(
     as1=0.25,
     bs1=0.5,
     kab=None,
+    doy=None,
 ):
     """Net radiation [MJ m-2 d-1].
 
@@ -85,6 +91,9 @@ def calc_rad_net(
         empirical coefficient for extraterrestrial radiation [-]
     kab: float, optional
         coefficient derived from as1, bs1 for estimating clear-sky radiation [degrees].
+    doy: float or array_like, optional
+        day of the year [-], used with rs and a float lat instead of the dates of
+        the inputs to compute the extraterrestrial radiation, e.g. for float inputs.
 
     Returns
     -------
@@ -100,8 +109,17 @@ def calc_rad_net(
         rn = check_rad(rn)
         return rn
     else:
+        rs = check_rad(rs)
+        ra = None
+        if rso is None:
+            # Compute ra once, for both the clear-sky and incoming solar radiation
+            if doy is None:
+                ra = extraterrestrial_r(get_index(n if rs is None else rs), lat)
+            else:
+                ra = _extraterrestrial_r(doy, lat)
+            rso = calc_rso(ra=ra, elevation=elevation, kab=kab)
         if rs is None:
-            rs = calc_rad_sol_in(n, lat, as1=as1, bs1=bs1, nn=nn)
+            rs = calc_rad_sol_in(n, lat, as1=as1, bs1=bs1, nn=nn, ra=ra)
         rns = calc_rad_short(
             rs=rs, lat=lat, n=n, nn=nn, albedo=albedo, as1=as1, bs1=bs1
         )  # [MJ/m2/d]
@@ -121,9 +139,7 @@ def calc_rad_net(
             ea=ea,
             kab=kab,
         )  # [MJ/m2/d]
-        rn = rns - rnl
-        rn = check_rad(rn)
-        return rn
+        return rns - rnl
 
 
 def calc_rad_long(
@@ -188,27 +204,32 @@ def calc_rad_long(
     Based on equation 39 in :cite:t:`allen_crop_1998`.
 
     """
-    if ea is None:
-        ea = calc_ea(tmean=tmean, tmax=tmax, tmin=tmin, rhmax=rhmax, rhmin=rhmin, rh=rh)
-
     if rso is None:
         tindex = get_index(rs)
         ra = extraterrestrial_r(tindex, lat)
         rso = calc_rso(ra=ra, elevation=elevation, kab=kab)
+
+    index, name, (rs, rso, tmean, tmax, tmin, rhmax, rhmin, rh, ea) = unwrap_aligned(
+        rs, rso, tmean, tmax, tmin, rhmax, rhmin, rh, ea
+    )
+
+    if ea is None:
+        ea = calc_ea(tmean=tmean, tmax=tmax, tmin=tmin, rhmax=rhmax, rhmin=rhmin, rh=rh)
+
     # Add a small constant to rso where it is zero to avoid division with zero
-    rso = rso.where(rso != 0, 0.001)
-    if len(rs.shape) == 3 and len(rso.shape) == 1:
+    rso = match_dtype(rso + 0.001 * (rso == 0), rs)
+    if ndim(rs) == 3 and ndim(rso) == 1:
         rso = rso.values[:, newaxis, newaxis]
-    solar_rat = clip(rs / rso, 0.3, 1)
+    solar_rat = minimum(maximum(rs / rso, 0.3), 1)
     if tmax is not None:
-        tmp1 = STEFAN_BOLTZMANN_DAY * ((tmax + 273.16) ** 4 + (tmin + 273.16) ** 4) / 2
+        tmp1 = STEFAN_BOLTZMANN_DAY / 2 * ((tmax + 273.16) ** 4 + (tmin + 273.16) ** 4)
     else:
         tmp1 = STEFAN_BOLTZMANN_DAY * (tmean + 273.16) ** 4
     tmp2 = 0.34 - 0.14 * sqrt(ea)  # OK
     tmp3 = a * solar_rat + b  # OK
-    tmp3 = clip(tmp3, 0.05, 1)
+    tmp3 = minimum(maximum(tmp3, 0.05), 1)
     rnl = tmp1 * tmp2 * tmp3
-    return rnl
+    return wrap_aligned(rnl, index, name)
 
 
 def calc_rad_short(rs=None, lat=None, albedo=0.23, n=None, nn=None, as1=0.25, bs1=0.5):
@@ -242,14 +263,13 @@ def calc_rad_short(rs=None, lat=None, albedo=0.23, n=None, nn=None, as1=0.25, bs
     Based on equation 38 in :cite:t:`allen_crop_1998`.
 
     """
-    (vrs,) = vectorize(rs)
-    if vrs is not None:
-        return (1 - albedo) * vrs
+    if rs is not None:
+        return (1 - albedo) * rs
     else:
         return (1 - albedo) * calc_rad_sol_in(n, lat, as1=as1, bs1=bs1, nn=nn)
 
 
-def calc_rad_sol_in(n, lat, as1=0.25, bs1=0.5, nn=None):
+def calc_rad_sol_in(n, lat, as1=0.25, bs1=0.5, nn=None, ra=None):
     """Incoming solar radiation [MJ m-2 d-1].
 
     Parameters
@@ -265,6 +285,9 @@ def calc_rad_sol_in(n, lat, as1=0.25, bs1=0.5, nn=None):
         empirical coefficient for extraterrestrial radiation [-].
     nn: pandas.Series/float, optional
         maximum possible duration of sunshine or daylight hours [hour].
+    ra: pandas.Series/xarray.DataArray, optional
+        Extraterrestrial daily radiation [MJ m-2 d-1]. Computed from the index of n
+        and lat if not provided.
 
     Returns
     -------
@@ -276,7 +299,8 @@ def calc_rad_sol_in(n, lat, as1=0.25, bs1=0.5, nn=None):
 
     """
     tindex = get_index(n)
-    ra = extraterrestrial_r(tindex, lat)
+    if ra is None:
+        ra = extraterrestrial_r(tindex, lat)
     if nn is None:
         nn = daylight_hours(tindex, lat)
     return (as1 + bs1 * n / nn) * ra
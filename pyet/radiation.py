@@ -6,7 +6,7 @@ from numpy import sqrt, log
 from xarray import DataArray
 from pandas import Series
 from .meteo_utils import extraterrestrial_r, calc_press, calc_psy, calc_vpc, calc_lambda
-from .utils import get_index, check_rad, clip_zeros, pet_out, check_rh
+from .utils import get_index, check_rad, clip_zeros, pet_out, check_rh, match_dtype
 
 
 def turc(tmean, rs, rh, k=0.013, clip_zero=True):
@@ -98,16 +98,16 @@ def jensen_haise(tmean, rs=None, cr=0.025, tx=-3, lat=None, method=0, clip_zero=
     lambd = calc_lambda(tmean)
     if method == 0:
         if rs is None:
-            raise Exception("If you choose method == 0, provide rs!")
+            raise ValueError("If you choose method == 0, provide rs!")
         pet = check_rad(rs) / lambd * cr * (tmean - tx)
     elif method == 1:
         if lat is None:
-            raise Exception("If you choose method == 1, provide lat!")
+            raise ValueError("If you choose method == 1, provide lat!")
         index = get_index(tmean)
         ra = extraterrestrial_r(index, lat, tmean)
         pet = ra * (tmean + 5) / 68 / lambd
     else:
-        raise Exception("Method can be either 0 or 1.")
+        raise ValueError("Method can be either 0 or 1.")
     pet = clip_zeros(pet, clip_zero)
     return pet_out(tmean, pet, "Jensen_Haise")
 
@@ -145,7 +145,7 @@ def mcguinness_bordne(tmean, lat, k=0.0147, clip_zero=True):
     """
     lambd = calc_lambda(tmean)
     index = get_index(tmean)
-    ra = extraterrestrial_r(index, lat)
+    ra = match_dtype(extraterrestrial_r(index, lat), tmean)
     if isinstance(tmean, DataArray) and isinstance(ra, Series):
         ra = ra.values[:, None, None]
     pet = k * ra * (tmean + 5) / lambd
@@ -203,7 +203,7 @@ def hargreaves(tmean, tmax, tmin, lat, k=0.0135, method=0, clip_zero=True):
     """
     lambd = calc_lambda(tmean)
     index = get_index(tmean)
-    ra = extraterrestrial_r(index, lat)
+    ra = match_dtype(extraterrestrial_r(index, lat), tmean)
     if isinstance(tmean, DataArray) and isinstance(ra, Series):
         ra = ra.values[:, None, None]
     else:
@@ -214,7 +214,7 @@ def hargreaves(tmean, tmax, tmin, lat, k=0.0135, method=0, clip_zero=True):
     elif method == 1:
         pet = k * chs * sqrt(tmax - tmin) * ra / lambd * (tmean + 17.8)
     else:
-        raise Exception("Method can be either 0 or 1.")
+        raise ValueError("Method can be either 0 or 1.")
     pet = clip_zeros(pet, clip_zero)
     return pet_out(tmean, pet, "Hargreaves")
 
@@ -352,7 +352,7 @@ def makkink(tmean, rs, pressure=None, elevation=None, k=0.65, clip_zero=True):
     gamma = calc_psy(pressure)
     dlt = calc_vpc(tmean)
     lambd = calc_lambda(tmean)
-    pet = k * dlt / (dlt + gamma) * check_rad(rs) / lambd
+    pet = k * dlt * check_rad(rs) / ((dlt + gamma) * lambd)
     pet = clip_zeros(pet, clip_zero)
     return pet_out(tmean, pet, "Makkink")
 
@@ -445,7 +445,7 @@ def oudin(tmean, lat, k1=100, k2=5, clip_zero=True):
     """
     lambd = calc_lambda(tmean)
     index = get_index(tmean)
-    ra = extraterrestrial_r(index, lat)
+    ra = match_dtype(extraterrestrial_r(index, lat), tmean)
     pet = ra * (tmean + k2) / lambd / k1
     pet = pet.where((tmean + k2) >= 0, 0)
     pet = clip_zeros(pet, clip_zero)
@@ -7,7 +7,7 @@ from pandas import date_range
 from xarray import DataArray
 
 from .meteo_utils import daylight_hours, calc_ea, calc_es, calc_e0
-from .utils import get_index, check_lat, clip_zeros, check_rh, pet_out
+from .utils import get_index, check_lat, clip_zeros, check_rh, pet_out, match_dtype
 
 
 def blaney_criddle(
@@ -93,10 +93,10 @@ def blaney_criddle(
     """
     index = get_index(tmean)
     if nn is None:
-        nn = daylight_hours(index, lat)
+        nn = match_dtype(daylight_hours(index, lat), tmean)
     if py is None:
         nn_sum = sum(daylight_hours(date_range("2000-1-1", "2000-12-31"), lat))
-        py = nn / nn_sum * 100
+        py = match_dtype(nn / nn_sum * 100, tmean)
     if isinstance(tmean, DataArray) and len(py.shape) == 1:
         py = py[:, None, None]
     if method == 0:
@@ -105,7 +105,7 @@ def blaney_criddle(
         pet = k * py * (0.46 * tmean + 8.13)
     elif method == 2:
         nn_sum = sum(daylight_hours(date_range("2000-1-1", "2000-12-31"), lat))
-        py = n / nn_sum * 100
+        py = match_dtype(n / nn_sum * 100, tmean)
         if isinstance(rhmin, DataArray) and len(nn.shape) == 1:
             nn = nn[:, None, None]
         k1 = 0.0043 * rhmin - n / nn - 1.41
@@ -127,7 +127,7 @@ def blaney_criddle(
         )
         pet = k1 + bvar * py * (0.46 * tmean + 8.13)
     else:
-        raise Exception("Method can be either 0, 1 or 2.")
+        raise ValueError("Method can be either 0, 1 or 2.")
     pet = clip_zeros(pet, clip_zero)
     return pet_out(tmean, pet, "Blaney_Criddle")
 
@@ -168,7 +168,7 @@ def haude(tmean, rh, k=1, clip_zero=True):
     # Haude coefficients from :cite:t:`schiff_berechnung_1975`
     fk = [0.27, 0.27, 0.28, 0.39, 0.39, 0.37, 0.35, 0.33, 0.31, 0.29, 0.27, 0.27]
     index = get_index(tmean)
-    fk1 = asarray([fk[x - 1] for x in index.month])
+    fk1 = match_dtype(asarray([fk[x - 1] for x in index.month]), tmean)
     if len(tmean.shape) > 1:
         f = fk1[:, newaxis, newaxis] * (tmean / tmean)
     else:
@@ -256,7 +256,7 @@ def hamon(
     """
     index = get_index(tmean)
     # Use transpose to work with lat either as int or xarray.DataArray
-    dl = daylight_hours(index, lat)
+    dl = match_dtype(daylight_hours(index, lat), tmean)
     if len(dl.shape) < len(tmean.shape):
         dl = tmean / tmean * dl[:, newaxis, newaxis]
     if method == 0:
@@ -277,7 +277,7 @@ def hamon(
         es = calc_es(tmean, tmax, tmin)
         pet = k * 14 * (n / 12) ** 2 * (216.7 * es * 10 / (tmean + 273.3)) / 100
     else:
-        raise Exception("method can be either 0, 1, 2 or 3.")
+        raise ValueError("method can be either 0, 1, 2 or 3.")
     pet = clip_zeros(pet, clip_zero)
     return pet_out(tmean, pet, "Hamon")
 
@@ -375,7 +375,7 @@ def linacre(tmean, elevation, lat, tdew=None, tmax=None, tmin=None, clip_zero=Tr
 
     """
     if tdew is None and tmax is None and tmin is None:
-        raise Exception("Please provide either Tdew or Tmax and Tmin!")
+        raise ValueError("Please provide either Tdew or Tmax and Tmin!")
     lat = check_lat(lat)
     lat_deg = lat / pi * 180
     if tdew is None:
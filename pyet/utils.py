@@ -1,3 +1,5 @@
+from numbers import Number
+
 import numpy
 from pandas import Series, DatetimeIndex
 from xarray import DataArray
@@ -43,7 +45,7 @@ def check_rad(rad):
         if numpy.nanmax(rad) < 100:
             return rad
         else:
-            raise Exception(
+            raise ValueError(
                 "The radiation input provided is greater than 100 MJ/m2d, "
                 "which is not realistic. Please convert the radiation input"
                 " to MJ/m2d."
@@ -56,7 +58,7 @@ def check_rh(rh):
         if numpy.nanmax(rh) > 1.0:
             return rh
         else:
-            raise Exception(
+            raise ValueError(
                 "The maximum value of relative humidity provided is smaller "
                 "than 1 [%], which is not realistic. Please convert the "
                 "relative humidity to [%]."
@@ -76,7 +78,7 @@ def check_lat(lat, shape=None):
             raise ValueError(f"lat must be a shaped as 2D DataArray")
         lat1 = lat.values
     if not (-1.6 < numpy.mean(lat1) < 1.6):
-        raise Exception(
+        raise ValueError(
             "Latitude must be provided in radians! Use pyet.deg_to_rad()"
             "to convert from degrees to radians."
         )
@@ -84,9 +86,10 @@ def check_lat(lat, shape=None):
 
 
 def clip_zeros(s, clip_zero):
-    """Method to replace negative values with 0 for Pandas.Series and xarray.DataArray."""
+    """Method to replace negative values with 0 for floats, pandas.Series and
+    xarray.DataArray."""
     if clip_zero:
-        s = s.where((s >= 0) | s.isnull(), 0)
+        s = numpy.maximum(s, 0)
     return s
 
 
@@ -107,18 +110,59 @@ def get_index(df):
     return index
 
 
+def match_dtype(arr, like):
+    """Method to cast arr to the floating point dtype of like, if it has one.
+
+    Quantities computed from the dates, like the extraterrestrial radiation, are
+    always float64. Casting them keeps the computation in the precision of the
+    meteorological inputs, e.g., float32 to halve the memory use for large grids.
+    """
+    dtype = getattr(like, "dtype", None)
+    if (
+        dtype is not None
+        and numpy.issubdtype(dtype, numpy.floating)
+        and getattr(arr, "dtype", dtype) != dtype
+    ):
+        return arr.astype(dtype)
+    return arr
+
+
+def get_common_index(*arrays):
+    """Method to return the index shared by all pandas.Series inputs.
+
+    Returns None if any input is an xarray.DataArray or if the pandas.Series
+    inputs do not all have the same index, i.e., when the arithmetic on the inputs
+    relies on pandas or xarray to align or broadcast them.
+    """
+    index = None
+    for arr in arrays:
+        if isinstance(arr, DataArray):
+            return None
+        elif isinstance(arr, Series):
+            if index is None:
+                index = arr.index
+            elif not (arr.index is index or arr.index.equals(index)):
+                return None
+    return index
+
+
 def vectorize(*arrays):
-    """Vectorize pandas.Series or xarray.DataArray inputs."""
+    """Vectorize pandas.Series or xarray.DataArray inputs.
+
+    The returned arrays are C-contiguous, so that element-wise operations on them
+    read memory in order. This only copies inputs that are non-contiguous views.
+    """
     vec_arrays = []
     for arr in arrays:
         if arr is None:
             vec_arr = None
-        elif isinstance(arr, (int, float)):
+        elif isinstance(arr, (Number, numpy.generic)):
             vec_arr = arr
-        elif isinstance(arr, Series):
-            vec_arr = arr.copy().values
-        elif isinstance(arr, DataArray):
-            vec_arr = arr.copy().values
+        elif isinstance(arr, numpy.ndarray):
+            # ascontiguousarray would turn a 0-d array into a 1-d array
+            vec_arr = arr if arr.ndim == 0 else numpy.ascontiguousarray(arr)
+        elif isinstance(arr, (Series, DataArray)):
+            vec_arr = numpy.ascontiguousarray(arr.values)
         else:
             raise TypeError(
                 f"Input must be a pandas.Series or xarray.DataArray, "
@@ -126,3 +170,29 @@ def vectorize(*arrays):
             )
         vec_arrays.append(vec_arr)
     return vec_arrays
+
+
+def unwrap_aligned(*arrays):
+    """Method to return the underlying arrays of aligned pandas.Series inputs.
+
+    If all pandas.Series inputs share the same index, the arithmetic on the inputs
+    is done on their underlying arrays, which avoids the overhead of pandas for each
+    operation. Returns the shared index, the name pandas would give the result (the
+    name shared by all pandas.Series, else None) and the arrays, or None, None and
+    the unchanged inputs otherwise. Use wrap_aligned to turn the results back into
+    pandas.Series.
+    """
+    index = get_common_index(*arrays)
+    if index is None:
+        return None, None, arrays
+    names = {arr.name for arr in arrays if isinstance(arr, Series)}
+    name = names.pop() if len(names) == 1 else None
+    return index, name, vectorize(*arrays)
+
+
+def wrap_aligned(arr, index, name=None):
+    """Method to return an array computed on the output of unwrap_aligned as a
+    pandas.Series with the shared index and name, if there is one."""
+    if index is None or not isinstance(arr, numpy.ndarray) or arr.ndim == 0:
+        return arr
+    return Series(arr, index, name=name)
@@ -25,3 +25,49 @@ class Testall(unittest.TestCase):
         et_df = et.calculate_all(tmean, wind, rs, elevation, lat, tmax, tmin,
                                  rh)
         self.assertIsInstance(et_df, pd.DataFrame)
+
+    def test_calculate_batch(self):
+        sites = {
+            "site1": pd.DataFrame({"tmean": tmean, "rs": rs}),
+            "site2": {"tmean": tmean + 1, "rs": rs, "elevation": 200},
+        }
+        et_df = et.calculate_batch(et.makkink, sites, max_workers=2, elevation=20)
+        self.assertIsInstance(et_df, pd.DataFrame)
+        self.assertEqual(list(et_df.columns), ["site1", "site2"])
+        pd.testing.assert_series_equal(
+            et_df["site2"], et.makkink(tmean + 1, rs, elevation=200), check_names=False
+        )
+        et_df1 = et.calculate_batch(et.makkink, sites, elevation=20)
+        pd.testing.assert_frame_equal(et_df, et_df1)
+
+    def test_numpy_scalars(self):
+        # numpy scalars (e.g. df["elev"].iloc[0]) and 0-d arrays behave like floats
+        kwargs = dict(rs=rs, lat=lat, tmax=tmax, tmin=tmin)
+        for method in [et.penman, et.pm_asce, et.pm, et.pm_fao56,
+                       et.kimberly_penman, et.thom_oliver, et.priestley_taylor]:
+            args = (tmean,) if method is et.priestley_taylor else (tmean, wind)
+            pe = method(*args, elevation=elevation, rh=50.0, **kwargs)
+            for elev, rh_ in [(np.int64(elevation), np.float32(50)),
+                              (np.array(20.0), np.array(50.0))]:
+                pe1 = method(*args, elevation=elev, rh=rh_, **kwargs)
+                pd.testing.assert_series_equal(pe1, pe)
+        rnl = et.calc_rad_long(rs, tmean=tmean, ea=1.5, rso=rs + 5)
+        rnl1 = et.calc_rad_long(rs, tmean=tmean, ea=np.float64(1.5), rso=rs + 5)
+        pd.testing.assert_series_equal(rnl1, rnl)
+
+    def test_float32(self):
+        # float32 inputs are computed in float32, close to the float64 results
+        args32 = [x.astype("float32") for x in (tmean, wind, rs, tmax, tmin, rh)]
+        et_df = et.calculate_all(tmean, wind, rs, elevation, lat, tmax, tmin, rh)
+        et_df32 = et.calculate_all(args32[0], args32[1], args32[2], elevation, lat,
+                                   args32[3], args32[4], args32[5])
+        for name in et_df32.columns:
+            self.assertEqual(et_df32[name].dtype, np.float32)
+            np.testing.assert_allclose(et_df32[name], et_df[name], atol=0.01)
+        # Also for xarray.DataArray inputs, which do not treat numpy scalars as weak
+        xr_args32 = [x.to_xarray().rename(index="time") for x in args32]
+        pe32 = et.pm_fao56(xr_args32[0], xr_args32[1], rs=xr_args32[2],
+                           elevation=elevation, lat=lat, tmax=xr_args32[3],
+                           tmin=xr_args32[4], rh=xr_args32[5])
+        self.assertEqual(pe32.dtype, np.float32)
+        np.testing.assert_allclose(pe32, et_df["FAO-56"], atol=0.01)
@@ -1,7 +1,7 @@
 import unittest
-from numpy import pi, array, full, testing
+from numpy import pi, array, full, testing, float32, int64
 from pandas import date_range, DatetimeIndex, Series
-from xarray import DataArray, Dataset
+from xarray import DataArray, Dataset, apply_ufunc
 import pyet as et
 
 
@@ -43,6 +43,11 @@ class TestFAO56(unittest.TestCase):
         expected_pressures.loc[{"time": "2020-01-02"}] = 87.9
         # Check that the results are as expected
         testing.assert_allclose(calculated_pressures.round(1), expected_pressures)
+        # A scalar elevation gives a float, a 0-d DataArray stays a DataArray
+        self.assertIs(type(et.calc_press(1800)), float)
+        pressure_xr = et.calc_press(DataArray(1800.0, coords={"site": "a"}))
+        self.assertIsInstance(pressure_xr, DataArray)
+        self.assertEqual(pressure_xr["site"], "a")
 
     def test_vpc(self):
         # Based on ASCE Table C-3
@@ -181,7 +186,56 @@ class TestFAO56(unittest.TestCase):
         rhmean = (82 + 54) / 2
         ea2 = et.calc_ea(tmax=25.0, tmin=18.0, rh=rhmean)
         self.assertAlmostEqual(ea1, 1.70, 2)
+        self.assertIsInstance(ea1, float)
         self.assertAlmostEqual(ea2, 1.78, 2)
+        ea3 = et.calc_ea(tmax=25.0, tmin=18.0, rhmax=82.0)
+        self.assertAlmostEqual(ea3, 1.69, 2)
+        # Missing rhmin or rhmax values are filled with the next best estimate
+        index = date_range(start="2020-1-1", periods=3)
+        ea4 = et.calc_ea(
+            tmax=Series(25.0, index=index),
+            tmin=Series(18.0, index=index),
+            rhmax=Series([82.0, 82.0, float("nan")], index=index),
+            rhmin=Series([54.0, float("nan"), 54.0], index=index),
+            rh=Series(rhmean, index=index),
+        )
+        testing.assert_allclose(ea4.round(2), [1.70, 1.69, 1.78])
+        with self.assertRaises(ValueError):
+            et.calc_ea(tmax=25.0, tmin=18.0)
+
+    def test_series_name(self):
+        # The name of the input Series is kept, as with pandas arithmetic
+        index = date_range(start="2020-1-1", periods=3)
+        tmean = Series([20.0, 21.0, 22.0], index=index, name="tmean")
+        self.assertEqual(et.calc_vpc(tmean).name, "tmean")
+        self.assertEqual(et.calc_es(tmean).name, "tmean")
+        rh = Series(60.0, index=index, name="rh")
+        self.assertIsNone(et.calc_ea(tmean=tmean, rh=rh).name)
+
+    def test_numpy_scalars(self):
+        # numpy scalars mixed with Series behave like Python floats
+        index = date_range(start="2020-1-1", periods=3)
+        tmean = Series([20.0, 21.0, 22.0], index=index)
+        ea = et.calc_ea(tmean=tmean, rh=float32(50))
+        testing.assert_allclose(ea, et.calc_ea(tmean=tmean, rh=50.0))
+        es = et.calc_es(tmax=tmean, tmin=int64(3))
+        testing.assert_allclose(es, et.calc_es(tmax=tmean, tmin=3.0))
+        self.assertAlmostEqual(et.calc_vpc(float32(20)), et.calc_vpc(20.0), 5)
+
+    def test_res_surf(self):
+        # Based on Example in Box 5, p. 22 FAO.
+        self.assertAlmostEqual(et.calc_res_surf(lai=24 * 0.12), 69.4, 1)
+        self.assertEqual(et.calc_res_surf(r_s=0), 0)
+        r_s = Series([70.0, 0.0], index=date_range(start="2020-1-1", periods=2))
+        testing.assert_allclose(et.calc_res_surf(r_s=r_s), r_s)
+
+    def test_invalid_methods(self):
+        with self.assertRaises(ValueError):
+            et.calc_laieff(lai=3.0, lai_eff=4)
+        with self.assertRaises(ValueError):
+            et.calc_res_aero(Series([2.0]), ra_method=2)
+        with self.assertRaises(ValueError):
+            et.calc_press(None)
 
     def test_relative_distance(self):
         # Based on Example 8, p. 47 FAO.
@@ -213,6 +267,17 @@ class TestFAO56(unittest.TestCase):
         extrar = et.extraterrestrial_r(DatetimeIndex(["2015-09-03"]), -0.35)
         self.assertAlmostEqual(float(extrar), 32.2, 1)
 
+    def test_extraterrestrial_r_cached(self):
+        # Repeated calls must not share (and corrupt) the cached values
+        tindex = date_range("2015-09-01", "2015-09-05")
+        extrar1 = et.extraterrestrial_r(tindex, -0.35)
+        extrar1.iloc[2] = 0.0
+        extrar2 = et.extraterrestrial_r(tindex, -0.35)
+        self.assertAlmostEqual(float(extrar2.iloc[2]), 32.2, 1)
+        # Same days of the year in another year give the same radiation
+        extrar3 = et.extraterrestrial_r(date_range("2017-09-01", "2017-09-05"), -0.35)
+        testing.assert_allclose(extrar2.values, extrar3.values)
+
     def test_daylight_hours(self):
         # Based on Example 9, p. 47 FAO.
         dayhours = et.daylight_hours(DatetimeIndex(["2015-09-03"]), -0.35)
@@ -228,6 +293,36 @@ class TestFAO56(unittest.TestCase):
         rnl = et.calc_rad_long(rs, tmax=tmax, tmin=tmin, ea=ea, rso=rso)
         self.assertAlmostEqual(float(rnl), 3.5, 1)
 
+    def test_scalar_inputs(self):
+        # Floats in, floats out, e.g. for xarray.apply_ufunc(..., vectorize=True)
+        # Based on Example 10, p. 52 FAO.
+        rnl = et.calc_rad_long(14.5, tmax=25.1, tmin=19.0, ea=2.1, rso=18.8)
+        self.assertAlmostEqual(float(rnl), 3.5, 1)
+        # Based on Example 18, p. 72 FAO.
+        et56 = et.pm_fao56(16.9, 2.078, rn=13.28, tmax=21.5, tmin=12.3, rhmax=84,
+                           rhmin=63, elevation=100)
+        self.assertAlmostEqual(float(et56), 3.9, 1)
+        # Without rn, the day of the year replaces the dates, 6 July is day 187
+        lat = 50.8 * pi / 180
+        et56 = et.pm_fao56(16.9, 2.078, rs=22.07, tmax=21.5, tmin=12.3, rhmax=84,
+                           rhmin=63, elevation=100, lat=lat, doy=187)
+        self.assertIsInstance(et56, float)
+        self.assertAlmostEqual(et56, 3.9, 1)
+        # And per cell with xarray.apply_ufunc
+        index = date_range("2015-07-06", periods=3)
+        tmean = DataArray(full((3, 2), 16.9), coords=[("time", index), ("x", [1, 2])])
+        doy = DataArray(index.dayofyear, coords=[("time", index)])
+        et56_xr = apply_ufunc(
+            lambda t, j: et.pm_fao56(t, 2.078, rs=22.07, tmax=21.5, tmin=12.3,
+                                     rhmax=84, rhmin=63, elevation=100, lat=lat,
+                                     doy=j),
+            tmean, doy, vectorize=True,
+        )
+        et56_s = et.pm_fao56(Series(16.9, index), 2.078, rs=Series(22.07, index),
+                             tmax=21.5, tmin=12.3, rhmax=84, rhmin=63,
+                             elevation=100, lat=lat)
+        testing.assert_allclose(et56_xr.sel(x=2), et56_s)
+
     def test_calc_rad_sol_in(self):
         # Based on example 10, p 50 TestFAO56
         lat = -22.9 * pi / 180